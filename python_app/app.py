@@ -3,7 +3,9 @@ import queue
 import threading
 import time
 import json
+import os
 from bot import TradingBot
+from logger import LogWriter
 
 app = Flask(__name__)
 
@@ -11,6 +13,11 @@ app = Flask(__name__)
 bot_thread = None
 bot_instance = None
 log_queue = queue.Queue()
+log_writer = LogWriter(
+    log_queue,
+    path=os.environ.get('BOT_LOG_FILE'),
+    level=os.environ.get('BOT_LOG_LEVEL', 'INFO'),
+).start()
 
 @app.route('/')
 def index():
@@ -35,7 +42,8 @@ def start_bot():
             timeframe=data['timeframe'],
             order_size=data['order_size'],
             leverage=data['leverage'],
-            log_queue=log_queue
+            log_queue=log_queue,
+            log_writer=log_writer
         )
         
         bot_thread = threading.Thread(target=bot_instance.run)
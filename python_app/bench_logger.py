@@ -0,0 +1,61 @@
+import io
+import queue
+import time
+
+from bot import TradingBot
+from logger import LogWriter
+
+# Per-call overhead of TradingBot.log on the trading thread, at real call-site shapes,
+# plus the writer-thread cost of formatting a large raw API response.
+# Run from python_app/: python bench_logger.py
+
+N = 200_000
+
+
+def timed(label, fn):
+    start = time.perf_counter_ns()
+    fn()
+    per_call = (time.perf_counter_ns() - start) / N / 1000
+    print(f"{label:<36} {per_call:.3f} µs/call")
+    return per_call
+
+
+def make_bot(writer):
+    return TradingBot(
+        api_key="key", api_secret="secret", base_url="http://localhost",
+        api_symbol="BTCUSD", ccxt_symbol="BTC/USDT:USDT", timeframe="15m",
+        order_size=1, leverage=10, log_queue=writer.log_queue, log_writer=writer,
+    )
+
+
+if __name__ == "__main__":
+    writer = LogWriter(queue.Queue(), stream=io.StringIO(), level="INFO", capacity=N).start()
+    bot = make_bot(writer)
+    price, signal = 64123.5, None
+    raw = '{"success":true,"result":{"id":1}}' + " " * 50_000
+
+    def enabled():
+        for _ in range(N):
+            bot.log("🕒 Price: %s | Signal: %s", "INFO", price, signal or 'None')
+
+    def filtered():
+        for _ in range(N):
+            bot.log("Supertrend Columns: %s", "DEBUG", raw)
+
+    def payload():
+        for _ in range(N):
+            bot.log("🌐 Raw: %s", "INFO", raw)
+
+    caller = [
+        timed("TradingBot.log price line (INFO)", enabled),
+        timed("TradingBot.log filtered (DEBUG)", filtered),
+        timed("TradingBot.log raw 50 KB (INFO)", payload),
+    ]
+    writer.close()
+
+    # Writer side: formatting cost grows with max_message, not with the payload size
+    fmt = writer._format
+    timed("writer _format raw 50 KB", lambda: [fmt("🌐 Raw: %s", (raw,)) for _ in range(N)])
+
+    worst = max(caller)
+    print(f"{'caller worst case':<36} {worst:.3f} µs/call ({'OK' if worst < 2 else 'OVER'} 2 µs budget)")
@@ -6,12 +6,11 @@ import requests
 import hmac
 import hashlib
 import json
-from datetime import datetime
 import threading
-import queue
+from logger import LogWriter
 
 class TradingBot:
-    def __init__(self, api_key, api_secret, base_url, api_symbol, ccxt_symbol, timeframe, order_size, leverage, log_queue):
+    def __init__(self, api_key, api_secret, base_url, api_symbol, ccxt_symbol, timeframe, order_size, leverage, log_queue, log_writer=None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
@@ -21,6 +20,10 @@ class TradingBot:
         self.order_size = float(order_size)
         self.leverage = int(leverage)
         self.log_queue = log_queue
+        # Bots normally share the app's writer; a standalone bot gets its own
+        self.log_writer = log_writer or LogWriter(log_queue).start()
+        # Bound directly to the writer to keep the per-call cost to a single frame
+        self.log = self.log_writer.log
         
         self.stop_event = threading.Event()
         
@@ -32,17 +35,6 @@ class TradingBot:
         self.current_position = None
         self.last_signal_time = None
 
-    def log(self, message, type="INFO"):
-        """Sends a log message to the queue for the UI."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = {
-            "time": timestamp,
-            "type": type,
-            "message": message
-        }
-        self.log_queue.put(log_entry)
-        print(f"[{timestamp}] [{type}] {message}", flush=True) # Keep console for debugging
-
     def sign_request(self, api_path, method, body):
         payload = json.dumps(body, separators=(',', ':'), sort_keys=True) if body else ""
         timestamp = str(int(time.time()))
@@ -64,12 +56,12 @@ class TradingBot:
             data = response.json()
             for product in data.get("result", []):
                 if product.get("symbol") == self.api_symbol:
-                    self.log(f"✅ Found product ID: {product['id']} for {self.api_symbol}", "SUCCESS")
+                    self.log("✅ Found product ID: %s for %s", "SUCCESS", product['id'], self.api_symbol)
                     return product["id"]
-            self.log(f"⚠️ Symbol {self.api_symbol} not found.", "ERROR")
+            self.log("⚠️ Symbol %s not found.", "ERROR", self.api_symbol)
             return None
         except Exception as e:
-            self.log(f"⚠️ Error fetching product ID: {str(e)}", "ERROR")
+            self.log("⚠️ Error fetching product ID: %s", "ERROR", e)
             return None
 
     def set_leverage(self):
@@ -80,11 +72,11 @@ class TradingBot:
         try:
             response = requests.post(self.base_url + endpoint, headers=headers, data=json.dumps(payload))
             if response.status_code == 200 and response.json().get('success'):
-                self.log(f"⚙️ Leverage set to {self.leverage}x", "SUCCESS")
+                self.log("⚙️ Leverage set to %sx", "SUCCESS", self.leverage)
             else:
-                self.log(f"❌ Failed to set leverage: {response.text}", "ERROR")
+                self.log("❌ Failed to set leverage: %s", "ERROR", response.text)
         except Exception as e:
-            self.log(f"⚠️ Error setting leverage: {str(e)}", "ERROR")
+            self.log("⚠️ Error setting leverage: %s", "ERROR", e)
 
     def fetch_ohlcv(self):
         try:
@@ -94,7 +86,7 @@ class TradingBot:
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
             return df
         except Exception as e:
-            self.log(f"Error fetching candles: {str(e)}", "ERROR")
+            self.log("Error fetching candles: %s", "ERROR", e)
             return pd.DataFrame()
 
     def calculate_supertrend(self, df, atr_period=10, factor=1.6):
@@ -104,7 +96,7 @@ class TradingBot:
                 self.log("Supertrend calculation returned empty/None", "ERROR")
                 return df
             
-            # self.log(f"Supertrend Columns: {list(supertrend.columns)}", "INFO") # Debug
+            self.log("Supertrend Columns: %s", "DEBUG", supertrend.columns)
             
             # pandas_ta returns columns like SUPERT_10_4.0, SUPERTd_10_4.0, SUPERTl_10_4.0, SUPERTs_10_4.0
             # We need to find the value column and the direction column dynamically
@@ -118,14 +110,14 @@ class TradingBot:
                     dir_col = col
             
             if not sup_col or not dir_col:
-                self.log(f"Could not find likely Supertrend columns in {list(supertrend.columns)}", "ERROR")
+                self.log("Could not find likely Supertrend columns in %s", "ERROR", list(supertrend.columns))
                 return df
 
             df = pd.concat([df, supertrend], axis=1)
             df.rename(columns={sup_col: 'supertrend', dir_col: 'direction'}, inplace=True)
             return df
         except Exception as e:
-            self.log(f"Error in supertrend calc: {e}", "ERROR")
+            self.log("Error in supertrend calc: %s", "ERROR", e)
             return df
 
     def generate_signal(self, df):
@@ -148,7 +140,7 @@ class TradingBot:
             return None
 
     def place_order(self, side):
-        self.log(f"🚀 Placing {side.upper()} order...", "INFO")
+        self.log("🚀 Placing %s order...", "INFO", side.upper())
         endpoint = '/v2/orders'
         order = {
             "product_id": self.product_id,
@@ -162,16 +154,16 @@ class TradingBot:
 
         try:
             response = requests.post(self.base_url + endpoint, headers=headers, data=payload)
-            self.log(f"🌐 Raw: {response.text}", "INFO") # Matched user script
+            self.log("🌐 Raw: %s", "INFO", response.text) # Matched user script; truncated by the writer
             
             res = response.json()
             if response.status_code == 200 and res.get('success'):
-                self.log(f"✅ Order executed successfully: {res.get('result', 'Success')}", "SUCCESS")
+                self.log("✅ Order executed successfully: %s", "SUCCESS", res.get('result', 'Success'))
             else:
                 error_msg = res.get('error', {}).get('message') or res.get('meta', {}).get('message', 'Unknown error')
-                self.log(f"❌ Failed: {error_msg}", "ERROR")
+                self.log("❌ Failed: %s", "ERROR", error_msg)
         except Exception as e:
-            self.log(f"⚠️ Order error: {str(e)}", "ERROR")
+            self.log("⚠️ Order error: %s", "ERROR", e)
 
     def run(self):
         self.log("🚦 Starting Supertrend Auto-Trader (Real-Time Mode)", "INFO")
@@ -195,33 +187,33 @@ class TradingBot:
                         price = df['close'].iloc[-1]
 
                         if self.last_signal_time != latest_timestamp:
-                            self.log(f"🕒 Price: {price} | Signal: {signal or 'None'}", "INFO")
+                            self.log("🕒 Price: %s | Signal: %s", "INFO", price, signal or 'None')
 
                             if signal:
                                 if self.current_position is None:
-                                    self.log(f"🔔 Opening {signal.upper()} position", "INFO")
+                                    self.log("🔔 Opening %s position", "INFO", signal.upper())
                                     self.place_order(signal)
                                     self.current_position = signal
                                 elif self.current_position != signal:
-                                    self.log(f"🔁 Reversing position from {self.current_position.upper()} to {signal.upper()}", "INFO")
+                                    self.log("🔁 Reversing position from %s to %s", "INFO", self.current_position.upper(), signal.upper())
                                     reverse_side = 'buy' if self.current_position == 'sell' else 'sell'
                                     self.place_order(reverse_side) # Close
                                     time.sleep(2)
                                     self.place_order(signal) # Open
                                     self.current_position = signal
                                 else:
-                                    self.log(f"🔄 Already in {self.current_position.upper()} – No action", "INFO")
+                                    self.log("🔄 Already in %s – No action", "INFO", self.current_position.upper())
 
                                 self.last_signal_time = latest_timestamp
                             else:
-                                self.log(f"📉 No trend change – Holding {self.current_position or 'No position'}", "INFO")
+                                self.log("📉 No trend change – Holding %s", "INFO", self.current_position or 'No position')
                         else:
-                            self.log(f"⏳ Same candle – Waiting...", "INFO")
+                            self.log("⏳ Same candle – Waiting...", "INFO")
                     else:
                         self.log("⚠️ Failed to calculate Supertrend (missing direction)", "ERROR")
 
             except Exception as e:
-                self.log(f"Runtime Error: {str(e)}", "ERROR")
+                self.log("Runtime Error: %s", "ERROR", e)
 
             time.sleep(10)  # Loop delay increased to 10s due to API instability
 
@@ -0,0 +1,166 @@
+import atexit
+import collections
+import numbers
+import sys
+import threading
+import time
+
+LEVELS = {
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+}
+
+
+class LogWriter:
+    """Structured log sink shared by bots.
+
+    `log()` only checks the level and appends a (timestamp, type, message, args)
+    record to a bounded deque, which is thread-safe without an explicit lock.
+    A background thread drains the deque in batches, formats the records, feeds
+    the UI queue and writes console/file output once per batch.
+
+    The console stream is flushed once per batch (not per line) so output still
+    shows up promptly when stdout is a pipe, e.g. under gunicorn on Render. The
+    log file is left to its own buffering and is flushed on `close()`.
+    """
+
+    def __init__(self, log_queue=None, stream=sys.stdout, path=None, level="INFO",
+                 max_message=1000, capacity=10000, interval=0.1):
+        self.log_queue = log_queue
+        self.stream = stream
+        self.file = open(path, "a", encoding="utf-8") if path else None
+        self.level = LEVELS.get(level.upper(), LEVELS["INFO"])
+        self.max_message = max_message
+        self.capacity = capacity
+        self.interval = interval
+        # Unknown types are never filtered
+        self._filtered = frozenset(name for name, value in LEVELS.items() if value < self.level)
+
+        # Oldest records are dropped if the writer falls more than `capacity` behind.
+        # `dropped` is a plain counter, so it is approximate under heavy contention.
+        self._records = collections.deque(maxlen=capacity)
+        self._append = self._records.append
+        self.dropped = 0
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = None
+        self._last_second = None
+        self._last_stamp = ""
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+        return self
+
+    def log(self, message, type="INFO", *args):
+        """Queues a record; `message % args` is only evaluated by the writer thread."""
+        if type in self._filtered:
+            return
+        if len(self._records) == self.capacity:
+            self.dropped += 1
+        self._append((time.time(), type, message, args))
+
+    def close(self):
+        self._closed.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        # The lock keeps this safe even if the join above timed out mid-batch
+        with self._flush_lock:
+            self._flush()
+            if self.file:
+                self.file.close()
+                self.file = None
+
+    def _run(self):
+        while not self._closed.wait(self.interval):
+            self.flush()
+
+    def _timestamp(self, ts):
+        second = int(ts)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_stamp = time.strftime("%H:%M:%S", time.localtime(second))
+        return self._last_stamp
+
+    def _format(self, message, args):
+        limit = self.max_message
+        truncated = 0
+        if args:
+            # Clip large payloads before interpolating so they are never copied in full.
+            # Numbers are kept as-is so %d / %.2f style formats still work.
+            clipped = []
+            for arg in args:
+                if not isinstance(arg, numbers.Number):
+                    arg = str(arg)
+                    if len(arg) > limit:
+                        truncated += len(arg) - limit
+                        arg = arg[:limit]
+                clipped.append(arg)
+            try:
+                message = message % tuple(clipped)
+            except (TypeError, ValueError):
+                message = " ".join([str(message)] + [str(a) for a in clipped])
+        else:
+            message = str(message)
+        if len(message) > limit:
+            truncated += len(message) - limit
+            message = message[:limit]
+        if truncated:
+            message = f"{message}… [{truncated} chars truncated]"
+        return message
+
+    def _emit(self, lines, ts, type, message):
+        timestamp = self._timestamp(ts)
+        if self.log_queue is not None:
+            self.log_queue.put({"time": timestamp, "type": type, "message": message})
+        lines.append(f"[{timestamp}] [{type}] {message}\n")
+
+    def flush(self):
+        """Drains all pending records. Called by the writer thread and on close."""
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        popleft = self._records.popleft
+        lines = []
+
+        dropped = self.dropped
+        if dropped:
+            self.dropped -= dropped
+            self._emit(lines, time.time(), "WARNING",
+                       f"⚠️ {dropped} log records dropped (log writer fell behind)")
+
+        while True:
+            try:
+                ts, type, message, args = popleft()
+            except IndexError:
+                break
+            try:
+                self._emit(lines, ts, type, self._format(message, args))
+            except Exception as e:
+                # One bad record (e.g. a raising __str__) must not stop all logging
+                try:
+                    self._emit(lines, ts, "ERROR", f"⚠️ Unformattable {type} log record: {e.__class__.__name__}")
+                except Exception:
+                    pass
+
+        if not lines:
+            return
+        text = "".join(lines)
+        try:
+            if self.stream:
+                self.stream.write(text)
+                self.stream.flush()
+        except (OSError, ValueError):
+            # Closed or broken console must never take the writer thread down
+            pass
+        try:
+            if self.file:
+                self.file.write(text)
+        except (OSError, ValueError):
+            pass
@@ -0,0 +1,104 @@
+import io
+import queue
+import time
+
+from logger import LogWriter
+
+# Behaviour checks for LogWriter. Run from python_app/: python test_logger.py (or pytest)
+
+
+def make_writer(**kwargs):
+    # Not started: tests drive flush() directly
+    return LogWriter(queue.Queue(), stream=io.StringIO(), **kwargs)
+
+
+def drain(writer):
+    writer.flush()
+    entries = []
+    while not writer.log_queue.empty():
+        entries.append(writer.log_queue.get_nowait())
+    return entries
+
+
+def test_queue_entry_shape():
+    writer = make_writer()
+    writer.log("🕒 Price: %s | Signal: %s", "INFO", 64123.5, "buy")
+    [entry] = drain(writer)
+    assert set(entry) == {"time", "type", "message"}
+    assert entry["type"] == "INFO"
+    assert entry["message"] == "🕒 Price: 64123.5 | Signal: buy"
+    assert len(entry["time"]) == 8
+    assert writer.stream.getvalue() == f"[{entry['time']}] [INFO] {entry['message']}\n"
+
+
+def test_level_filtering():
+    writer = make_writer(level="SUCCESS")
+    writer.log("dropped", "DEBUG")
+    writer.log("dropped", "INFO")
+    writer.log("kept", "SUCCESS")
+    writer.log("kept", "ERROR")
+    writer.log("kept", "CUSTOM")
+    assert [e["type"] for e in drain(writer)] == ["SUCCESS", "ERROR", "CUSTOM"]
+
+
+def test_truncation():
+    writer = make_writer(max_message=20)
+    writer.log("x" * 50, "ERROR")
+    writer.log("🌐 Raw: %s", "INFO", "y" * 50)
+    plain, raw = drain(writer)
+    assert plain["message"] == "x" * 20 + "… [30 chars truncated]"
+    full = "🌐 Raw: " + "y" * 50
+    assert raw["message"] == f"{full[:20]}… [{len(full) - 20} chars truncated]"
+
+
+def test_bad_format_falls_back():
+    writer = make_writer()
+    writer.log("bad %d", "INFO", "z")
+    writer.log("missing %s %s", "INFO", "one")
+    assert [e["message"] for e in drain(writer)] == ["bad %d z", "missing %s %s one"]
+
+
+def test_bad_record_does_not_stop_logging():
+    class Broken:
+        def __str__(self):
+            raise RuntimeError("boom")
+
+    writer = make_writer()
+    writer.log("value: %s", "INFO", Broken())
+    writer.log("still logging", "INFO")
+    broken, ok = drain(writer)
+    assert broken["type"] == "ERROR" and "RuntimeError" in broken["message"]
+    assert ok["message"] == "still logging"
+
+
+def test_dropped_records_are_reported():
+    writer = make_writer(capacity=3)
+    for i in range(5):
+        writer.log("record %s", "INFO", i)
+    warning, *rest = drain(writer)
+    assert warning["type"] == "WARNING" and "2 log records dropped" in warning["message"]
+    assert [e["message"] for e in rest] == ["record 2", "record 3", "record 4"]
+    assert writer.dropped == 0
+
+
+def test_timestamp_cache():
+    writer = make_writer()
+    now = time.time()
+    first = writer._timestamp(now)
+    assert first == time.strftime("%H:%M:%S", time.localtime(int(now)))
+    assert writer._timestamp(int(now) + 0.5) is first
+    assert writer._timestamp(now + 1) == time.strftime("%H:%M:%S", time.localtime(int(now) + 1))
+
+
+def test_background_writer_and_close():
+    writer = LogWriter(queue.Queue(), stream=io.StringIO(), interval=0.01).start()
+    writer.log("from thread", "INFO")
+    writer.close()
+    assert drain(writer)[0]["message"] == "from thread"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"ok  {name}")